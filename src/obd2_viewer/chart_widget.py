@@ -33,7 +33,7 @@ class ChannelPlotWidget(pg.PlotWidget):
         # Multi-import support: list of data lines, one per import
         self.data_lines: List[Optional[pg.PlotDataItem]] = []
         self.import_colors: List[str] = []
-        self.import_data: List[Dict] = []  # [{x, y, offset, visible}, ...]
+        self.import_data: List[Dict] = []  # [{x, y, x_lod, y_lod, offset, visible}, ...]
         self._current_hover_values: List[Optional[float]] = []
         
         # Configure plot appearance
@@ -44,7 +44,8 @@ class ChannelPlotWidget(pg.PlotWidget):
         self.setAntialiasing(False)  # Faster rendering
         
         # Set title with larger font for channel name and value
-        self.setTitle(f'<span style="font-size: 11pt; font-weight: bold;">{channel_name}</span> <span style="font-size: 10pt; color: #666;">({unit})</span>')
+        self._base_title = self._format_base_title(channel_name, unit)
+        self.setTitle(self._base_title)
         self.setLabel('left', '', units=unit)
         self.setLabel('bottom', 'Time (s)') # don't use units='s' so we avoid SI prefixes
         
@@ -83,8 +84,6 @@ class ChannelPlotWidget(pg.PlotWidget):
         
     def wheelEvent(self, event):
         """Override wheel event - Ctrl+scroll zooms X axis, otherwise scroll container."""
-        from PyQt6.QtCore import Qt
-        
         if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
             # Ctrl+scroll: zoom X axis
             delta = event.angleDelta().y()
@@ -137,9 +136,16 @@ class ChannelPlotWidget(pg.PlotWidget):
         """Update the plot title and unit labels (used when editing math channels)."""
         self.channel_name = channel_name
         self.unit = unit
-        self.setTitle(f'<span style="font-size: 11pt; font-weight: bold;">{channel_name}</span> <span style="font-size: 10pt; color: #666;">({unit})</span>')
+        self._base_title = self._format_base_title(channel_name, unit)
+        self.setTitle(self._base_title)
         self.setLabel('left', '', units=unit)
     
+    @staticmethod
+    def _format_base_title(channel_name: str, unit: str) -> str:
+        """Build the title HTML (channel name and unit, no values)."""
+        return (f'<span style="font-size: 11pt; font-weight: bold;">{channel_name}</span> '
+                f'<span style="font-size: 10pt; color: #666;">({unit})</span>')
+    
     def set_import_count(self, count: int, colors: List[str]):
         """Initialize data structures for the given number of imports."""
         # Clear existing data lines
@@ -149,7 +155,8 @@ class ChannelPlotWidget(pg.PlotWidget):
         
         self.data_lines = [None] * count
         self.import_colors = colors
-        self.import_data = [{'x': None, 'y': None, 'offset': 0.0, 'visible': True} for _ in range(count)]
+        self.import_data = [{'x': None, 'y': None, 'x_lod': None, 'y_lod': None, 'offset': 0.0, 'visible': True}
+                            for _ in range(count)]
         self._current_hover_values = [None] * count
     
     def set_import_data(self, import_index: int, x: np.ndarray, y: np.ndarray, offset: float = 0.0):
@@ -160,6 +167,8 @@ class ChannelPlotWidget(pg.PlotWidget):
         self.import_data[import_index] = {
             'x': x,
             'y': y,
+            'x_lod': None,
+            'y_lod': None,
             'offset': offset,
             'visible': self.import_data[import_index].get('visible', True)
         }
@@ -170,8 +179,12 @@ class ChannelPlotWidget(pg.PlotWidget):
                 self.data_lines[import_index].setData([], [])
             return
         
-        # Apply LOD downsampling for performance
-        x_display, y_display = self._apply_lod(x, y, offset)
+        # Apply LOD downsampling for performance. The bins don't depend on the
+        # offset, so keep the offset-free result for update_import_offset()
+        x_lod, y_lod = self._apply_lod(x, y, 0.0)
+        self.import_data[import_index]['x_lod'] = x_lod
+        self.import_data[import_index]['y_lod'] = y_lod
+        x_display, y_display = x_lod + offset, y_lod
         
         color = self.import_colors[import_index] if import_index < len(self.import_colors) else '#1976D2'
         
@@ -212,31 +225,18 @@ class ChannelPlotWidget(pg.PlotWidget):
         # Peak-preserving downsampling: keep min and max in each bin
         # This preserves spikes and dips that simple decimation would miss
         n_bins = len(x) // factor
-        x_out = []
-        y_out = []
-        
-        for i in range(n_bins):
-            start = i * factor
-            end = min(start + factor, len(x))
-            chunk_y = y[start:end]
-            chunk_x = x_display[start:end]
-            
-            if len(chunk_y) == 0:
-                continue
-                
-            # Find min and max indices
-            min_idx = np.argmin(chunk_y)
-            max_idx = np.argmax(chunk_y)
-            
-            # Add points in time order
-            if min_idx < max_idx:
-                x_out.extend([chunk_x[min_idx], chunk_x[max_idx]])
-                y_out.extend([chunk_y[min_idx], chunk_y[max_idx]])
-            else:
-                x_out.extend([chunk_x[max_idx], chunk_x[min_idx]])
-                y_out.extend([chunk_y[max_idx], chunk_y[min_idx]])
+        bins = y[:n_bins * factor].reshape(n_bins, factor)
+        min_idx = np.argmin(bins, axis=1)
+        max_idx = np.argmax(bins, axis=1)
+        
+        # Add points in time order (min first when it comes first in the bin)
+        min_first = min_idx < max_idx
+        first = np.where(min_first, min_idx, max_idx)
+        second = np.where(min_first, max_idx, min_idx)
+        offsets = np.arange(n_bins) * factor
+        indices = np.column_stack((offsets + first, offsets + second)).ravel()
         
-        return np.array(x_out), np.array(y_out)
+        return x_display[indices], y[indices]
     
     def set_import_visible(self, import_index: int, visible: bool):
         """Set visibility of a specific import's data line."""
@@ -253,9 +253,8 @@ class ChannelPlotWidget(pg.PlotWidget):
         data = self.import_data[import_index]
         data['offset'] = offset
         
-        if data['x'] is not None and len(data['x']) > 0 and self.data_lines[import_index]:
-            x_display, y_display = self._apply_lod(data['x'], data['y'], offset)
-            self.data_lines[import_index].setData(x_display, y_display)
+        if data['x_lod'] is not None and self.data_lines[import_index]:
+            self.data_lines[import_index].setData(data['x_lod'] + offset, data['y_lod'])
     
     def update_import_color(self, import_index: int, color: str):
         """Update the color for a specific import."""
@@ -302,7 +301,6 @@ class ChannelPlotWidget(pg.PlotWidget):
     def mouse_clicked(self, event):
         """Handle mouse click for crosshair positioning and centering view."""
         # Only handle left clicks
-        from PyQt6.QtCore import Qt
         if event.button() != Qt.MouseButton.LeftButton:
             return
             
@@ -342,17 +340,14 @@ class ChannelPlotWidget(pg.PlotWidget):
         
         if value_parts:
             values_str = ' | '.join(value_parts)
-            self.setTitle(
-                f'<span style="font-size: 11pt; font-weight: bold;">{self.channel_name}</span> '
-                f'<span style="font-size: 10pt; color: #666;">({self.unit})</span> = {values_str}'
-            )
+            self.setTitle(f'{self._base_title} = {values_str}')
         
         self.vLine.setPos(x)
     
     def clear_hover_value(self):
         """Clear the hover value from title."""
         self._current_hover_values = [None] * len(self.import_data)
-        self.setTitle(f'<span style="font-size: 11pt; font-weight: bold;">{self.channel_name}</span> <span style="font-size: 10pt; color: #666;">({self.unit})</span>')
+        self.setTitle(self._base_title)
     
     def _refresh_title(self):
         """Refresh the title with current hover values and updated colors."""
@@ -365,12 +360,9 @@ class ChannelPlotWidget(pg.PlotWidget):
         
         if value_parts:
             values_str = ' | '.join(value_parts)
-            self.setTitle(
-                f'<span style="font-size: 11pt; font-weight: bold;">{self.channel_name}</span> '
-                f'<span style="font-size: 10pt; color: #666;">({self.unit})</span> = {values_str}'
-            )
+            self.setTitle(f'{self._base_title} = {values_str}')
         else:
-            self.setTitle(f'<span style="font-size: 11pt; font-weight: bold;">{self.channel_name}</span> <span style="font-size: 10pt; color: #666;">({self.unit})</span>')
+            self.setTitle(self._base_title)
 
 
 class OBD2ChartWidget(QWidget):
@@ -507,7 +499,8 @@ class OBD2ChartWidget(QWidget):
         
         sorted_channels = sorted(channels, key=get_channel_sort_key)
         
-        # Create new plots
+        # Create new plots (X axes are all linked to the first one)
+        first_plot = None
         for channel in sorted_channels:
             # Get display name and unit from first import that has this channel
             display_name = channel
@@ -529,8 +522,9 @@ class OBD2ChartWidget(QWidget):
             plot.enableAutoRange(axis='x', enable=False)
             
             # Link X axis to other plots
-            if self.plots:
-                first_plot = list(self.plots.values())[0]
+            if first_plot is None:
+                first_plot = plot
+            else:
                 plot.setXLink(first_plot)
             
             # Connect signals
@@ -589,7 +583,7 @@ class OBD2ChartWidget(QWidget):
         
         # Link X axis to other plots
         if self.plots:
-            first_plot = list(self.plots.values())[0]
+            first_plot = next(iter(self.plots.values()))
             plot.setXLink(first_plot)
         
         # Connect signals
@@ -786,8 +780,9 @@ class OBD2ChartWidget(QWidget):
                 self.plots_layout.addWidget(self.plots[channel])
         
         # Add any remaining plots not in the order list (shouldn't happen, but safety)
+        ordered = set(channel_order)
         for channel, plot in self.plots.items():
-            if channel not in channel_order:
+            if channel not in ordered:
                 self.plots_layout.addWidget(plot)
     
     def set_filter_mask(self, filter_masks: Optional[Dict[int, Dict[str, np.ndarray]]], 
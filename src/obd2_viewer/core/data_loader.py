@@ -8,7 +8,6 @@ multiple formats, multi-channel files, and automatic delimiter detection.
 
 import pandas as pd
 import os
-import glob
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 import logging
@@ -43,7 +42,7 @@ class OBDDataLoader:
         Returns:
             Tuple of (channels_data, units_mapping)
         """
-        csv_files = list(self.data_directory.glob("*.csv"))
+        csv_files = self._find_csv_files()
         
         logger.info(f"Found {len(csv_files)} CSV files in {self.data_directory}")
         
@@ -66,6 +65,21 @@ class OBDDataLoader:
             logger.error(f"Error loading {csv_file.name}: {e}")
             raise
     
+    def _find_csv_files(self) -> List[Path]:
+        """
+        List the CSV files directly inside the data directory.
+        
+        Returns:
+            List of CSV file paths (empty if the directory does not exist)
+        """
+        if not self.data_directory.is_dir():
+            return []
+        
+        # Match the extension case-insensitively (e.g. LOG.CSV), as glob does on Windows
+        with os.scandir(self.data_directory) as entries:
+            return [Path(entry.path) for entry in entries
+                    if entry.name.lower().endswith('.csv') and entry.is_file()]
+    
     def load_single_file(self, file_path: str) -> Tuple[Dict[str, pd.DataFrame], Dict[str, str]]:
         """
         Load a single CSV file.
@@ -88,7 +102,7 @@ class OBDDataLoader:
         if not self.data_directory.exists():
             return False, f"Directory does not exist: {self.data_directory}"
         
-        csv_files = list(self.data_directory.glob("*.csv"))
+        csv_files = self._find_csv_files()
         if not csv_files:
             return False, f"No CSV files found in directory: {self.data_directory}"
         
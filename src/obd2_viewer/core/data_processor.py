@@ -14,6 +14,24 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _golden_ratio_color(index: int) -> str:
+    """Hex color for the given sequence index (golden-ratio hue spacing)."""
+    hue = (index * 0.618033988749895) % 1
+    rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.8)
+    return '#%02x%02x%02x' % tuple(int(c * 255) for c in rgb)
+
+
+# Precomputed colors for the first indices (well above MultiChannelCSVParser.MAX_CHANNELS)
+_COLOR_PALETTE = [_golden_ratio_color(i) for i in range(256)]
+
+
+def _color_for_index(index: int) -> str:
+    """Look up the color for an index, computing it only past the palette."""
+    if index < len(_COLOR_PALETTE):
+        return _COLOR_PALETTE[index]
+    return _golden_ratio_color(index)
+
+
 class OBDDataProcessor:
     """
     Processes and analyzes OBD2 data.
@@ -46,8 +64,15 @@ class OBDDataProcessor:
         
         for pid, df in data.items():
             if 'SECONDS' in df.columns:
-                mask = (df['SECONDS'] >= start_time) & (df['SECONDS'] <= end_time)
-                filtered_df = df[mask].copy()
+                seconds = df['SECONDS']
+                if seconds.is_monotonic_increasing:
+                    # Sorted data: binary search for the slice bounds instead of masking
+                    lo = seconds.searchsorted(start_time, side='left')
+                    hi = seconds.searchsorted(end_time, side='right')
+                    filtered_df = df.iloc[lo:hi].copy()
+                else:
+                    mask = (seconds >= start_time) & (seconds <= end_time)
+                    filtered_df = df[mask].copy()
                 filtered_data[pid] = filtered_df
             else:
                 # If no SECONDS column, include the data as-is
@@ -68,15 +93,16 @@ class OBDDataProcessor:
         if not data:
             return 0.0, 0.0
             
-        all_times = []
-        for df in data.values():
-            if 'SECONDS' in df.columns:
-                all_times.extend(df['SECONDS'].values)
+        times = [df['SECONDS'].to_numpy() for df in data.values() if 'SECONDS' in df.columns]
+        if not times:
+            return 0.0, 0.0
         
-        if not all_times:
+        all_times = np.concatenate(times)
+        # Ignore NaN timestamps (the single-channel parser keeps those rows)
+        if all_times.size == 0 or np.isnan(all_times).all():
             return 0.0, 0.0
             
-        return min(all_times), max(all_times)
+        return float(np.nanmin(all_times)), float(np.nanmax(all_times))
     
     def generate_colors(self, pids: List[str]) -> Dict[str, str]:
         """
@@ -88,16 +114,7 @@ class OBDDataProcessor:
         Returns:
             Dictionary mapping PID names to hex color codes
         """
-        colors = {}
-        
-        for i, pid in enumerate(pids):
-            # Use golden ratio for better color distribution
-            hue = (i * 0.618033988749895) % 1
-            rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.8)
-            color = '#%02x%02x%02x' % tuple(int(c * 255) for c in rgb)
-            colors[pid] = color
-            
-        return colors
+        return {pid: _color_for_index(i) for i, pid in enumerate(pids)}
     
     def get_next_color(self) -> str:
         """
@@ -106,9 +123,7 @@ class OBDDataProcessor:
         Returns:
             Hex color code
         """
-        hue = (self.color_index * 0.618033988749895) % 1
-        rgb = colorsys.hsv_to_rgb(hue, 0.8, 0.8)
-        color = '#%02x%02x%02x' % tuple(int(c * 255) for c in rgb)
+        color = _color_for_index(self.color_index)
         self.color_index += 1
         return color
     
@@ -128,8 +143,7 @@ class OBDDataProcessor:
             return False
             
         self.groups[group_name] = pids.copy()
-        for pid in pids:
-            self.pid_groups[pid] = group_name
+        self.pid_groups.update(dict.fromkeys(pids, group_name))
             
         logger.info(f"Created group '{group_name}' with {len(pids)} PIDs")
         return True
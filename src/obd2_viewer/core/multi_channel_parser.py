@@ -15,6 +15,9 @@ from scipy import interpolate
 
 logger = logging.getLogger(__name__)
 
+# Characters replaced with '_' in channel names (single pass via str.translate)
+_SEPARATOR_TABLE = str.maketrans(dict.fromkeys(' -./\\()[]{}', '_'))
+
 
 class MultiChannelCSVParser:
     """
@@ -54,8 +57,11 @@ class MultiChannelCSVParser:
         logger.info(f"Parsing multi-channel CSV: {file_path_obj.name} ({file_size_mb:.1f}MB)")
         
         try:
-            # Read the CSV file
-            df = pd.read_csv(file_path, delimiter=';')
+            # Read the CSV file, keeping only the columns we use (this also drops the
+            # empty column produced by the trailing ';'). A callable keeps missing
+            # columns from failing the read, so the check below reports them.
+            required = set(self.required_columns)
+            df = pd.read_csv(file_path, delimiter=';', usecols=lambda col: col in required)
             
             # Validate required columns
             missing_columns = [col for col in self.required_columns if col not in df.columns]
@@ -93,8 +99,7 @@ class MultiChannelCSVParser:
         channel_name = self._sanitize_channel_name(channel_name)
         
         # Create channel data
-        channel_df = df[['SECONDS', 'VALUE']].copy()
-        channel_df = channel_df.sort_values('SECONDS').reset_index(drop=True)
+        channel_df = self._sort_by_time(df)
         
         # Get units
         units = {channel_name: 'unknown'}
@@ -120,26 +125,23 @@ class MultiChannelCSVParser:
         if unique_channels > self.MAX_CHANNELS:
             raise ValueError(f"Too many channels ({unique_channels}). Maximum allowed: {self.MAX_CHANNELS}")
         
-        # Group data by PID
+        # Group data by PID in a single pass (first-appearance order, NaN PIDs dropped)
         channels_data = {}
         units_mapping = {}
+        grouped = df.groupby('PID', sort=False)
         
         # Get all unique PIDs and their units
-        channel_info = df.groupby('PID')['UNITS'].first().to_dict()
+        channel_info = grouped['UNITS'].first().to_dict()
         
         # Create common timestamp grid
         all_timestamps = sorted(df['SECONDS'].unique())
         
-        for pid in df['PID'].unique():
-            if pd.isna(pid):
-                continue
-                
+        for pid, pid_df in grouped:
             # Clean channel name
             channel_name = self._sanitize_channel_name(str(pid))
             
             # Get data for this channel
-            channel_df = df[df['PID'] == pid][['SECONDS', 'VALUE']].copy()
-            channel_df = channel_df.sort_values('SECONDS').reset_index(drop=True)
+            channel_df = self._sort_by_time(pid_df)
             
             # Interpolate to common timestamp grid
             interpolated_df = self._interpolate_to_grid(channel_df, all_timestamps)
@@ -150,6 +152,24 @@ class MultiChannelCSVParser:
         logger.info(f"Successfully parsed {len(channels_data)} channels")
         return channels_data, units_mapping
     
+    def _sort_by_time(self, df: pd.DataFrame) -> pd.DataFrame:
+        """
+        Extract SECONDS and VALUE sorted by time.
+        
+        Sorts the two numpy columns with one argsort instead of reindexing
+        the whole frame through sort_values.
+        
+        Args:
+            df: DataFrame containing at least SECONDS and VALUE columns
+            
+        Returns:
+            New DataFrame with SECONDS and VALUE columns and a fresh index
+        """
+        seconds = df['SECONDS'].to_numpy()
+        values = df['VALUE'].to_numpy()
+        order = np.argsort(seconds)
+        return pd.DataFrame({'SECONDS': seconds[order], 'VALUE': values[order]})
+    
     def _interpolate_to_grid(self, channel_df: pd.DataFrame, target_timestamps: List[float]) -> pd.DataFrame:
         """
         Interpolate channel data to a common timestamp grid.
@@ -221,18 +241,8 @@ class MultiChannelCSVParser:
         Returns:
             Sanitized channel name
         """
-        # Remove problematic characters
-        sanitized = channel_name.replace(' ', '_')
-        sanitized = sanitized.replace('-', '_')
-        sanitized = sanitized.replace('.', '_')
-        sanitized = sanitized.replace('/', '_')
-        sanitized = sanitized.replace('\\', '_')
-        sanitized = sanitized.replace('(', '_')
-        sanitized = sanitized.replace(')', '_')
-        sanitized = sanitized.replace('[', '_')
-        sanitized = sanitized.replace(']', '_')
-        sanitized = sanitized.replace('{', '_')
-        sanitized = sanitized.replace('}', '_')
+        # Replace separator characters with underscores
+        sanitized = channel_name.translate(_SEPARATOR_TABLE)
         
         # Remove any characters that aren't alphanumeric or underscores
         sanitized = ''.join(c for c in sanitized if c.isalnum() or c == '_')
@@ -297,17 +307,21 @@ class MultiChannelCSVParser:
                 'units': {}
             }
         
-        # Calculate summary statistics
-        all_timestamps = []
+        # Calculate summary statistics (reduce per channel, then across channels)
+        starts = []
+        ends = []
         total_points = 0
         
         for channel_name, df in channels_data.items():
-            all_timestamps.extend(df['SECONDS'].values)
             total_points += len(df)
-        
-        if all_timestamps:
-            time_start = min(all_timestamps)
-            time_end = max(all_timestamps)
+            if len(df) > 0:
+                seconds = df['SECONDS']
+                starts.append(seconds.min())
+                ends.append(seconds.max())
+        
+        if starts:
+            time_start = min(starts)
+            time_end = max(ends)
             duration = time_end - time_start
         else:
             time_start = time_end = duration = 0
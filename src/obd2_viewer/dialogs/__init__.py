@@ -13,6 +13,7 @@ from .relocate_files_dialog import RelocateFilesDialog
 # Expression evaluation helpers (used by main_window for channel creation)
 from .expression_helpers import (
     EXPRESSION_HELP_TEXT,
+    align_to_times,
     get_math_functions,
     get_statistical_functions,
 )
@@ -26,6 +27,7 @@ __all__ = [
     'SaveViewDialog',
     'RelocateFilesDialog',
     'EXPRESSION_HELP_TEXT',
+    'align_to_times',
     'get_math_functions',
     'get_statistical_functions',
 ]
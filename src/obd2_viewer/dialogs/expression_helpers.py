@@ -18,6 +18,37 @@ EXPRESSION_HELP_TEXT = (
 )
 
 
+def align_to_times(times: np.ndarray, times_ch: np.ndarray, values: np.ndarray) -> np.ndarray:
+    """Align a channel's values to the given time points (nearest neighbor).
+    
+    Args:
+        times: Sorted target time points
+        times_ch: Sorted time points of the source channel
+        values: Values of the source channel
+    
+    Returns:
+        Array of source values at the nearest source time for each target time.
+        Ties go to the later sample; times outside the source range take the
+        first/last value. An empty source channel gives zeros. The result keeps
+        the dtype of ``values``.
+    """
+    if len(times_ch) == 0:
+        return np.zeros(len(times))
+    if len(times_ch) == 1:
+        return np.full(len(times), values[0])
+    
+    raw_indices = np.searchsorted(times_ch, times)
+    indices = np.clip(raw_indices, 1, len(times_ch) - 1)
+    
+    # Choose nearest neighbor
+    diff_before = times - times_ch[indices - 1]
+    diff_after = times_ch[indices] - times
+    aligned = np.where(diff_after <= diff_before, values[indices], values[indices - 1])
+    aligned = np.where(raw_indices == 0, values[0], aligned)
+    aligned = np.where(raw_indices >= len(times_ch), values[-1], aligned)
+    return aligned
+
+
 def get_math_functions():
     """Return dict of safe math functions available in expressions."""
     return {
@@ -8,16 +8,21 @@ time navigation, and the chart display area.
 
 import json
 import logging
+import math
+from itertools import groupby
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import numpy as np
+import pandas as pd
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QSplitter,
     QFileDialog, QMessageBox, QScrollArea, QFrame, QLabel,
     QPushButton, QGroupBox, QStatusBar, QApplication, QSizePolicy,
-    QStackedWidget, QColorDialog, QCheckBox
+    QStackedWidget, QColorDialog, QCheckBox, QGridLayout
 )
-from PyQt6.QtCore import Qt, QSettings, pyqtSignal, QTimer
+from PyQt6.QtCore import Qt, QEvent, QSettings, pyqtSignal, QTimer
 from PyQt6.QtGui import QAction, QKeySequence, QColor
 
 from .chart_widget import OBD2ChartWidget
@@ -28,7 +33,7 @@ from .widgets import (
 )
 from .dialogs import (
     LoadingDialog, SynchronizeDialog, MathChannelDialog, FilterDialog,
-    CreatingChannelDialog, get_math_functions, get_statistical_functions
+    CreatingChannelDialog, align_to_times, get_math_functions, get_statistical_functions
 )
 from .app_data import load_recent_files, save_recent_files, list_saved_views
 from .view_manager import ViewManager
@@ -101,6 +106,7 @@ class OBD2MainWindow(QMainWindow):
         # Max channel name length for column calculation
         self._max_channel_name_length = 0
         self._last_column_count = 1  # Track last column count to detect changes
+        self._channel_layout_key = None  # Last (shown, hidden, cols) laid out in the sidebar
         
         # Debounced resize timer for re-layout
         self._resize_timer = QTimer()
@@ -638,7 +644,7 @@ class OBD2MainWindow(QMainWindow):
         self._update_zoom_slider()
         
         # Update status
-        total_channels = len(set().union(*[set(imp.channels_data.keys()) for imp in self.imports]))
+        total_channels = len(set().union(*(imp.channels_data.keys() for imp in self.imports)))
         total_points = sum(
             sum(len(df) for df in imp.channels_data.values()) 
             for imp in self.imports
@@ -683,6 +689,7 @@ class OBD2MainWindow(QMainWindow):
             self.channel_list_layout.removeWidget(control)
             control.deleteLater()
         self.channel_controls.clear()
+        self._channel_layout_key = None
         
         # Remove all items from layout (including section headers)
         while self.channel_list_layout.count() > 0:
@@ -793,7 +800,6 @@ class OBD2MainWindow(QMainWindow):
     
     def eventFilter(self, obj, event):
         """Handle events for filtered objects."""
-        from PyQt6.QtCore import QEvent
         if obj == self.channel_group and event.type() == QEvent.Type.Resize:
             # Debounce resize events
             self._resize_timer.start()
@@ -814,16 +820,6 @@ class OBD2MainWindow(QMainWindow):
         
         Uses multi-column layout with column-first flow within each unit subsection.
         """
-        from PyQt6.QtWidgets import QGridLayout, QFrame
-        
-        # Remove all widgets from layout (but don't delete controls)
-        while self.channel_list_layout.count() > 0:
-            item = self.channel_list_layout.takeAt(0)
-            widget = item.widget()
-            # Only delete section headers (QLabel/QFrame), not controls
-            if widget and widget not in self.channel_controls.values():
-                widget.deleteLater()
-        
         # Separate shown and hidden controls
         shown_controls = []
         hidden_controls = []
@@ -841,6 +837,26 @@ class OBD2MainWindow(QMainWindow):
         # Get column count
         num_cols = self._get_column_count()
         
+        # Skip the rebuild if the layout would come out identical (e.g. a toggle
+        # that was undone before the sort timer fired)
+        layout_key = (
+            tuple((c.channel_name, c.unit) for c in shown_controls),
+            tuple((c.channel_name, c.unit) for c in hidden_controls),
+            num_cols,
+        )
+        if layout_key == self._channel_layout_key:
+            return
+        self._channel_layout_key = layout_key
+        
+        # Remove all widgets from layout (but don't delete controls)
+        controls = set(self.channel_controls.values())
+        while self.channel_list_layout.count() > 0:
+            item = self.channel_list_layout.takeAt(0)
+            widget = item.widget()
+            # Only delete section headers (QLabel/QFrame), not controls
+            if widget and widget not in controls:
+                widget.deleteLater()
+        
         def add_section_header(text: str, color: str = "#1976D2"):
             """Add a section header label."""
             header = QLabel(f"<b>{text}</b>")
@@ -883,20 +899,7 @@ class OBD2MainWindow(QMainWindow):
         # Group controls by unit
         def group_by_unit(controls):
             """Group controls by unit, preserving sort order."""
-            groups = []
-            current_unit = None
-            current_group = []
-            for control in controls:
-                if control.unit != current_unit:
-                    if current_group:
-                        groups.append((current_unit, current_group))
-                    current_unit = control.unit
-                    current_group = [control]
-                else:
-                    current_group.append(control)
-            if current_group:
-                groups.append((current_unit, current_group))
-            return groups
+            return [(unit, list(group)) for unit, group in groupby(controls, key=attrgetter('unit'))]
         
         # Add Shown section
         if shown_controls:
@@ -1022,9 +1025,6 @@ class OBD2MainWindow(QMainWindow):
     
     def _apply_math_channels_to_imports(self):
         """Apply all defined math channels to imports that don't have them yet."""
-        import numpy as np
-        import pandas as pd
-        
         if not self.math_channels:
             return
         
@@ -1069,22 +1069,10 @@ class OBD2MainWindow(QMainWindow):
                         times_ch = df['SECONDS'].values
                         values_raw = df['VALUE'].values
                         
-                        # Align to A's time points
-                        aligned = np.zeros(len(times))
-                        for i, t in enumerate(times):
-                            idx = np.searchsorted(times_ch, t)
-                            if idx == 0:
-                                aligned[i] = values_raw[0]
-                            elif idx >= len(times_ch):
-                                aligned[i] = values_raw[-1]
-                            else:
-                                diff_before = t - times_ch[idx - 1]
-                                diff_after = times_ch[idx] - t
-                                if diff_after <= diff_before:
-                                    aligned[i] = values_raw[idx]
-                                else:
-                                    aligned[i] = values_raw[idx - 1]
-                        aligned_values[label] = aligned
+                        # Align to A's time points (nearest neighbor), as float so
+                        # expressions like A ** -1 work on integer channels
+                        aligned = align_to_times(times, times_ch, values_raw)
+                        aligned_values[label] = aligned.astype(float, copy=False)
                     else:
                         aligned_values[label] = np.zeros(len(times))
                 
@@ -1134,9 +1122,6 @@ class OBD2MainWindow(QMainWindow):
             unit: Output unit
             replacing: Name of channel being replaced (for edit mode)
         """
-        import numpy as np
-        import pandas as pd
-        
         # Parse inputs JSON
         inputs = json.loads(inputs_json)
         
@@ -1188,22 +1173,10 @@ class OBD2MainWindow(QMainWindow):
                     times_ch = df['SECONDS'].values
                     values_raw = df['VALUE'].values
                     
-                    # Align to A's time points (nearest neighbor)
-                    aligned = np.zeros(len(times))
-                    for i, t in enumerate(times):
-                        idx = np.searchsorted(times_ch, t)
-                        if idx == 0:
-                            aligned[i] = values_raw[0]
-                        elif idx >= len(times_ch):
-                            aligned[i] = values_raw[-1]
-                        else:
-                            diff_before = t - times_ch[idx - 1]
-                            diff_after = times_ch[idx] - t
-                            if diff_after <= diff_before:
-                                aligned[i] = values_raw[idx]
-                            else:
-                                aligned[i] = values_raw[idx - 1]
-                    aligned_values[label] = aligned
+                    # Align to A's time points (nearest neighbor), as float so
+                    # expressions like A ** -1 work on integer channels
+                    aligned = align_to_times(times, times_ch, values_raw)
+                    aligned_values[label] = aligned.astype(float, copy=False)
                 else:
                     aligned_values[label] = np.zeros(len(times))
             
@@ -1501,16 +1474,15 @@ class OBD2MainWindow(QMainWindow):
         matches a filter at time t, ALL imports are considered to match at that
         time (adjusted for their time offsets).
         """
-        import numpy as np
-        
         if not self.imports:
             return
         
         # Collect enabled filters in order
-        active_filters = []
-        for name in self.filter_order:
-            if name in self.filters and self.filters[name].get('enabled', True):
-                active_filters.append((name, self.filters[name]))
+        filters = self.filters
+        active_filters = [
+            (name, filters[name]) for name in self.filter_order
+            if name in filters and filters[name].get('enabled', True)
+        ]
         
         if not active_filters:
             # No active filters - show all data
@@ -1548,20 +1520,7 @@ class OBD2MainWindow(QMainWindow):
                         times_ch = df['SECONDS'].values
                         values_raw = df['VALUE'].values
                         
-                        # Vectorized alignment using searchsorted
-                        indices = np.searchsorted(times_ch, times)
-                        indices = np.clip(indices, 1, len(times_ch) - 1)
-                        
-                        # Choose nearest neighbor
-                        diff_before = times - times_ch[indices - 1]
-                        diff_after = times_ch[indices] - times
-                        use_after = diff_after <= diff_before
-                        
-                        aligned = np.where(use_after, values_raw[indices], values_raw[indices - 1])
-                        aligned = np.where(indices == 0, values_raw[0], aligned)
-                        aligned = np.where(indices >= len(times_ch), values_raw[-1], aligned)
-                        
-                        aligned_values[label] = aligned
+                        aligned_values[label] = align_to_times(times, times_ch, values_raw)
                     else:
                         aligned_values[label] = np.zeros(len(times))
                 
@@ -1667,7 +1626,7 @@ class OBD2MainWindow(QMainWindow):
             
             # Compute visible intervals from the final mask for NaN separators
             if channel_masks:
-                ref_channel = list(imp.channels_data.keys())[0]
+                ref_channel = next(iter(imp.channels_data))
                 ref_times = imp.channels_data[ref_channel]['SECONDS'].values
                 ref_mask = channel_masks[ref_channel]
                 
@@ -1690,7 +1649,7 @@ class OBD2MainWindow(QMainWindow):
                 if visible_intervals:
                     filter_intervals[imp_idx] = visible_intervals
             
-            visible_count = np.sum(list(channel_masks.values())[0]) if channel_masks else 0
+            visible_count = np.sum(next(iter(channel_masks.values()))) if channel_masks else 0
             logger.info(f"Import {imp_idx}: Final filter result, {visible_count} visible points, {len(filter_intervals.get(imp_idx, []))} intervals")
         
         # Pass filter masks and intervals to chart widget
@@ -1759,6 +1718,7 @@ class OBD2MainWindow(QMainWindow):
             self.channel_list_layout.removeWidget(control)
             control.deleteLater()
         self.channel_controls.clear()
+        self._channel_layout_key = None
         
         # Remove stretch
         while self.channel_list_layout.count() > 0:
@@ -1954,7 +1914,6 @@ class OBD2MainWindow(QMainWindow):
             return
         
         # Inverse of exponential: value = 100 * log(duration/max) / log(min/max)
-        import math
         ratio = math.log(current_duration / max_duration) / math.log(min_duration / max_duration)
         slider_value = int(ratio * 100)
         slider_value = max(0, min(100, slider_value))
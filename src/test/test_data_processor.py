@@ -0,0 +1,151 @@
+"""
+Unit tests for OBDDataProcessor.
+
+The sorted-data path of filter_data_by_time slices with searchsorted
+instead of building a boolean mask. These tests check that:
+1. It returns exactly what the mask returns for sorted, unsorted, and
+   NaN-containing SECONDS columns, duplicate edges, and empty windows
+2. get_time_range and resample_data ignore NaN timestamps
+"""
+
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from obd2_viewer.core.data_processor import OBDDataProcessor
+
+
+def mask_filter(df, start_time, end_time):
+    """Reference implementation: plain boolean mask on SECONDS."""
+    mask = (df['SECONDS'] >= start_time) & (df['SECONDS'] <= end_time)
+    return df[mask].copy()
+
+
+def create_test_channel(times, index=None):
+    """Create a channel DataFrame with VALUE derived from its position."""
+    times = np.asarray(times, dtype=float)
+    return pd.DataFrame({'SECONDS': times, 'VALUE': np.arange(len(times), dtype=float)}, index=index)
+
+
+def assert_matches_mask(df, start_time, end_time):
+    """Assert filter_data_by_time equals the mask version, index included."""
+    result = OBDDataProcessor().filter_data_by_time({'ch': df}, start_time, end_time)['ch']
+    pd.testing.assert_frame_equal(result, mask_filter(df, start_time, end_time))
+    return result
+
+
+class TestFilterDataByTime:
+    """Test the time window filter against the boolean-mask reference."""
+
+    def test_sorted_window(self):
+        """Sorted data returns the inclusive window."""
+        result = assert_matches_mask(create_test_channel([0, 1, 2, 3, 4, 5]), 1.0, 3.0)
+        assert result['SECONDS'].tolist() == [1.0, 2.0, 3.0]
+
+    def test_unsorted_data(self):
+        """Unsorted data falls back to the mask and keeps row order."""
+        result = assert_matches_mask(create_test_channel([5, 1, 3, 0, 2, 4]), 1.0, 3.0)
+        assert result['SECONDS'].tolist() == [1.0, 3.0, 2.0]
+
+    def test_nan_timestamps(self):
+        """NaN timestamps are excluded, as with the mask."""
+        result = assert_matches_mask(create_test_channel([0, 1, np.nan, 3, 4]), 0.5, 3.5)
+        assert result['SECONDS'].tolist() == [1.0, 3.0]
+
+    def test_duplicate_timestamps_on_edges(self):
+        """All duplicates at the window edges are kept."""
+        result = assert_matches_mask(create_test_channel([0, 1, 1, 2, 3, 3, 4]), 1.0, 3.0)
+        assert result['SECONDS'].tolist() == [1.0, 1.0, 2.0, 3.0, 3.0]
+
+    def test_start_after_end(self):
+        """A reversed window is empty."""
+        result = assert_matches_mask(create_test_channel([0, 1, 2, 3]), 3.0, 1.0)
+        assert len(result) == 0
+
+    def test_window_outside_data(self):
+        """A window entirely outside the data is empty."""
+        result = assert_matches_mask(create_test_channel([0, 1, 2]), 5.0, 6.0)
+        assert len(result) == 0
+
+    def test_non_default_index_preserved(self):
+        """The original index labels are kept on the sliced rows."""
+        df = create_test_channel([0, 1, 2, 3], index=[10, 20, 30, 40])
+        result = assert_matches_mask(df, 1.0, 2.0)
+        assert result.index.tolist() == [20, 30]
+
+    def test_result_is_a_copy(self):
+        """Modifying the result does not touch the input."""
+        df = create_test_channel([0, 1, 2, 3])
+        result = assert_matches_mask(df, 1.0, 2.0)
+        result['VALUE'] = -1.0
+        assert df['VALUE'].tolist() == [0.0, 1.0, 2.0, 3.0]
+
+    def test_empty_channel(self):
+        """An empty channel stays empty, keeping its columns."""
+        result = assert_matches_mask(create_test_channel([]), 0.0, 1.0)
+        assert len(result) == 0
+        assert list(result.columns) == ['SECONDS', 'VALUE']
+
+    def test_channel_without_seconds(self):
+        """Channels without SECONDS are returned unfiltered."""
+        df = pd.DataFrame({'VALUE': [1.0, 2.0]})
+        result = OBDDataProcessor().filter_data_by_time({'ch': df}, 0.0, 1.0)['ch']
+        pd.testing.assert_frame_equal(result, df)
+
+    def test_randomized_against_mask(self):
+        """Random sorted/unsorted/NaN inputs all match the mask version."""
+        rng = np.random.default_rng(0)
+        for trial in range(200):
+            n = int(rng.integers(0, 40))
+            times = np.round(np.sort(rng.uniform(0, 10, n)), 1)
+            if trial % 3 == 0:
+                times = rng.permutation(times)
+            if trial % 7 == 0 and n:
+                times[0] = np.nan
+            df = create_test_channel(times, index=rng.permutation(n) + 100)
+            start_time, end_time = rng.uniform(-1, 11, 2)
+            assert_matches_mask(df, start_time, end_time)
+
+
+class TestGetTimeRange:
+    """Test the overall time range across channels."""
+
+    def test_min_max_across_channels(self):
+        """The range spans every channel."""
+        data = {'a': create_test_channel([1, 2, 3]), 'b': create_test_channel([0.5, 4])}
+        assert OBDDataProcessor().get_time_range(data) == (0.5, 4.0)
+
+    def test_nan_timestamp_ignored(self):
+        """A NaN timestamp does not turn the range into NaN."""
+        data = {'ch': create_test_channel([0, np.nan, 1, 2])}
+        assert OBDDataProcessor().get_time_range(data) == (0.0, 2.0)
+
+    def test_all_nan_timestamps(self):
+        """Only NaN timestamps gives the empty range."""
+        data = {'ch': create_test_channel([np.nan, np.nan])}
+        assert OBDDataProcessor().get_time_range(data) == (0.0, 0.0)
+
+    def test_empty_data(self):
+        """No channels, or empty channels, give the empty range."""
+        assert OBDDataProcessor().get_time_range({}) == (0.0, 0.0)
+        assert OBDDataProcessor().get_time_range({'ch': create_test_channel([])}) == (0.0, 0.0)
+
+
+class TestResampleData:
+    """Test resampling onto a regular time grid."""
+
+    def test_nan_timestamp(self):
+        """A channel with a NaN timestamp still resamples over its real range."""
+        data = {'ch': create_test_channel([0, np.nan, 1, 2])}
+        result = OBDDataProcessor().resample_data(data, target_interval=0.5)['ch']
+        assert result['SECONDS'].tolist() == [0.0, 0.5, 1.0, 1.5, 2.0]
+        assert not result['VALUE'].isna().any()
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,76 @@
+"""
+Unit tests for expression helper functions.
+
+Tests align_to_times (nearest-neighbor alignment used by math channels
+and filters) to ensure:
+1. Empty source channels align to zeros instead of raising
+2. Single-sample sources fill every target time
+3. Times outside the source range take the first/last value
+4. Ties between two samples go to the later sample
+"""
+
+import numpy as np
+import sys
+import os
+
+# Add parent directory to path for imports
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from obd2_viewer.dialogs.expression_helpers import align_to_times
+
+
+class TestAlignToTimes:
+    """Test nearest-neighbor alignment of a channel to target times."""
+
+    def test_empty_source_and_targets(self):
+        """Empty source with no target times gives an empty array."""
+        result = align_to_times(np.array([]), np.array([]), np.array([]))
+        assert len(result) == 0
+
+    def test_empty_source(self):
+        """Empty source aligns to zeros rather than raising IndexError."""
+        times = np.array([0.0, 1.0, 2.0])
+        result = align_to_times(times, np.array([]), np.array([]))
+        np.testing.assert_array_equal(result, [0.0, 0.0, 0.0])
+
+    def test_single_sample(self):
+        """A single source sample fills every target time."""
+        times = np.array([-5.0, 0.0, 3.0, 10.0])
+        result = align_to_times(times, np.array([3.0]), np.array([7.0]))
+        np.testing.assert_array_equal(result, [7.0, 7.0, 7.0, 7.0])
+
+    def test_out_of_range_times(self):
+        """Times before/after the source range take the first/last value."""
+        times_ch = np.array([1.0, 2.0, 3.0])
+        values = np.array([10.0, 20.0, 30.0])
+        times = np.array([-100.0, 0.0, 4.0, 100.0])
+        result = align_to_times(times, times_ch, values)
+        np.testing.assert_array_equal(result, [10.0, 10.0, 30.0, 30.0])
+
+    def test_nearest_neighbor(self):
+        """Interior times take the value of the nearest source sample."""
+        times_ch = np.array([0.0, 1.0, 2.0])
+        values = np.array([10.0, 20.0, 30.0])
+        times = np.array([0.0, 0.2, 0.8, 1.0, 1.4, 2.0])
+        result = align_to_times(times, times_ch, values)
+        np.testing.assert_array_equal(result, [10.0, 10.0, 20.0, 20.0, 20.0, 30.0])
+
+    def test_ties_go_to_later_sample(self):
+        """A time exactly halfway between two samples takes the later one."""
+        times_ch = np.array([0.0, 1.0, 2.0])
+        values = np.array([10.0, 20.0, 30.0])
+        times = np.array([0.5, 1.5])
+        result = align_to_times(times, times_ch, values)
+        np.testing.assert_array_equal(result, [20.0, 30.0])
+
+    def test_keeps_source_dtype(self):
+        """Integer sources stay integer (math channel callers cast to float)."""
+        times_ch = np.array([0.0, 1.0])
+        values = np.array([1, 2], dtype=np.int64)
+        result = align_to_times(np.array([0.0, 1.0]), times_ch, values)
+        assert result.dtype == np.int64
+
+
+if __name__ == '__main__':
+    import pytest
+    pytest.main([__file__, '-v'])
@@ -11,7 +11,6 @@ Tests the _apply_filters logic to ensure:
 import pytest
 import numpy as np
 import pandas as pd
-from unittest.mock import MagicMock, patch
 import sys
 import os
 
@@ -12,44 +12,46 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from obd2_viewer.core.multi_channel_parser import MultiChannelCSVParser
 
+EXPECTED_CHANNELS = frozenset({
+    "Engine_RPM",
+    "Vehicle_speed",
+    "Calculated_engine_load_value",
+})
+
 
 class TestMultiChannelParser(unittest.TestCase):
     """Test the multi-channel CSV parser functionality."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.parser = MultiChannelCSVParser()
-        self.test_csv = Path(__file__).parent / "nov_4_test_data.csv"
+    @classmethod
+    def setUpClass(cls):
+        """Parse the test CSV once - the tests below only read the result."""
+        cls.parser = MultiChannelCSVParser()
+        cls.test_csv = Path(__file__).parent / "nov_4_test_data.csv"
+        if not cls.test_csv.exists():
+            raise FileNotFoundError(f"Test CSV file should exist: {cls.test_csv}")
+        cls.channels_data, cls.units = cls.parser.parse_csv_file(str(cls.test_csv))
     
     def test_parse_csv_file(self):
         """Test parsing a multi-channel CSV file."""
-        self.assertTrue(self.test_csv.exists(), "Test CSV file should exist")
-        
-        channels_data, units = self.parser.parse_csv_file(str(self.test_csv))
+        channels_data, units = self.channels_data, self.units
         
         # Verify basic parsing
         self.assertGreater(len(channels_data), 0, "Should parse at least one channel")
         self.assertGreater(len(units), 0, "Should extract units")
         
         # Check specific expected channels
-        expected_channels = [
-            "Engine_RPM",
-            "Vehicle_speed", 
-            "Calculated_engine_load_value"
-        ]
+        missing = EXPECTED_CHANNELS - channels_data.keys()
+        self.assertFalse(missing, f"Missing channels: {sorted(missing)}")
         
-        for channel in expected_channels:
-            self.assertIn(channel, channels_data, f"Should find channel {channel}")
+        for channel in EXPECTED_CHANNELS:
             df = channels_data[channel]
             self.assertGreater(len(df), 0, f"Channel {channel} should have data")
             self.assertIn("SECONDS", df.columns, f"Channel {channel} should have SECONDS column")
             self.assertIn("VALUE", df.columns, f"Channel {channel} should have VALUE column")
-        
-        print(f"✅ Successfully parsed {len(channels_data)} channels")
     
     def test_get_import_summary(self):
         """Test import summary generation."""
-        channels_data, units = self.parser.parse_csv_file(str(self.test_csv))
+        channels_data, units = self.channels_data, self.units
         
         summary = self.parser.get_import_summary(channels_data, units)
         
@@ -62,16 +64,12 @@ class TestMultiChannelParser(unittest.TestCase):
         self.assertEqual(summary["channel_count"], len(channels_data))
         self.assertGreater(summary["total_data_points"], 0)
         self.assertGreater(summary["duration"], 0)
-        
-        print(f"✅ Import summary: {summary['channel_count']} channels, {summary['total_data_points']} points")
     
     def test_interpolation(self):
         """Test that channels are interpolated to common time grid."""
-        channels_data, units = self.parser.parse_csv_file(str(self.test_csv))
-        
         # Get time ranges for all channels
         time_ranges = []
-        for channel, df in channels_data.items():
+        for channel, df in self.channels_data.items():
             if len(df) > 0:
                 time_ranges.append((df['SECONDS'].min(), df['SECONDS'].max()))
         
@@ -87,12 +85,10 @@ class TestMultiChannelParser(unittest.TestCase):
                     first_range[1], time_range[1], places=1,
                     msg=f"Channel {i} should have same end time"
                 )
-        
-        print("✅ Interpolation working correctly - all channels on same time grid")
     
     def test_units_extraction(self):
         """Test that units are correctly extracted."""
-        channels_data, units = self.parser.parse_csv_file(str(self.test_csv))
+        units = self.units
         
         # Check specific units
         expected_units = {
@@ -105,8 +101,6 @@ class TestMultiChannelParser(unittest.TestCase):
             if channel in units:
                 self.assertEqual(units[channel], expected_unit, 
                                f"Channel {channel} should have unit {expected_unit}")
-        
-        print(f"✅ Units extracted correctly for {len(units)} channels")
 
 
 if __name__ == '__main__':